@@ -1,34 +1,22 @@
-from typing import Literal
+from functools import lru_cache
+from typing import NamedTuple
 import streamlit as st
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-class WithCalcPower:
-    """
-    A mixin class providing the `total_power` property 
-    to calculate power based on voltage and current.
-    """
-    voltage: int
-    current: int
-    
-    @property
-    def total_power(self) -> int:
-        return self.voltage * self.current
-
-
-@dataclass
-class Panel(WithCalcPower):
+@dataclass(slots=True, frozen=True)
+class Panel:
     """
     Represents an individual solar panel with voltage and current
     """
     voltage: int
     current: int
+    total_power: int = field(init=False)
 
-MergedPanel = Panel
-PanelGroup = list[Panel]
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "total_power", self.voltage * self.current)
 
-@dataclass
-class Output(WithCalcPower):
+class Output(NamedTuple):
     """
     Represetns the system output
     """
@@ -37,8 +25,11 @@ class Output(WithCalcPower):
     num_series: int
     num_parallel: int
 
-@dataclass
-class Optimized(WithCalcPower):
+    @property
+    def total_power(self) -> int:
+        return self.voltage * self.current
+
+class Optimized(NamedTuple):
     """
     Represents the optimal system output
     """
@@ -48,50 +39,78 @@ class Optimized(WithCalcPower):
     num_parallel: int
     loss_power: int
 
+    @property
+    def total_power(self) -> int:
+        return self.voltage * self.current
 
 
-def group_panels(panels: list[Panel], chunk_size: int) -> list[PanelGroup]:
-    return [panels[i : i + chunk_size] for i in range(0, len(panels), chunk_size)]
-
 
-def series_panels(panels: list[Panel]) -> MergedPanel:
-    v = sum(panel.voltage for panel in panels)  # sum of voltages
-    i = panels[0].current  # current remains the same in series
-    return Panel(v, i)
+@lru_cache(maxsize=128)
+def _divisors(n: int) -> tuple[int, ...]:
+    """
+    Divisors of `n` in ascending order, found by trial division up to sqrt(n).
+    """
+    found: set[int] = set()
+    for d in range(1, int(n**0.5) + 1):
+        if n % d == 0:
+            found.add(d)
+            found.add(n // d)
+    return tuple(sorted(found))
+
+
+# st.cache_data persists results across Streamlit reruns (each rerun re-executes
+# the script and rebuilds the lru_cache); max_power stays out of the key because
+# it only affects the loss_power computed in optimize().
+@st.cache_data
+@lru_cache(maxsize=None)
+def _optimize(voltage: int, current: int, total: int, max_voltage: int, max_current: int) -> Output | None:
+    # All panels are identical, so grouping reduces to plain arithmetic:
+    # `group_size` panels in series give `group_size * voltage`, and the
+    # `total // group_size` groups in parallel give `(total // group_size) * current`.
+    # Only divisors of the panel count yield evenly-sized groups, and divisor
+    # pairs (d, total // d) cover both series-heavy and parallel-heavy layouts.
+    best: tuple[int, int, int, int] | None = None
+    best_power = 0
 
+    for group_size in _divisors(total):
+        num_parallel = total // group_size
+        v = group_size * voltage
+        i = num_parallel * current
 
-def parallel_panels(panels: list[Panel]) -> MergedPanel:
-    v = panels[0].voltage  # voltage remains the same
-    i = sum(panel.current for panel in panels)  # sum of current
-    return Panel(v, i)
+        if v > max_voltage:
+            # voltage grows with group_size, so no larger divisor can fit
+            break
+        if i > max_current:
+            # current shrinks as group_size grows, so a larger divisor may still fit
+            continue
 
+        if v * i > best_power:
+            best_power = v * i
+            best = (v, i, group_size, num_parallel)
 
-def evaluate(panels: list[Panel], chunk_size: int) -> Output:
-    groups = group_panels(panels=panels, chunk_size=chunk_size)
-    series = [series_panels(panels) for panels in groups]
-    result = parallel_panels(series)
-    num_series = chunk_size
-    num_parallel = len(series)
+    if best is None:
+        return None
 
+    v, i, num_series, num_parallel = best
     return Output(
-        voltage=result.voltage,
-        current=result.current,
+        voltage=v,
+        current=i,
         num_series=num_series,
         num_parallel=num_parallel,
     )
 
 
-def optimize(panels, max_voltage, max_current, max_power) -> Optimized | None:
-    best_config: Output | None = None
-    best_power = 0
-
-    for group_size in range(1, len(panels) + 1):
-        output: Output = evaluate(panels, group_size)
-
-        if output.voltage <= max_voltage and output.current <= max_current:
-            if output.total_power > best_power:
-                best_power = output.total_power
-                best_config = output
+def optimize(
+    panel_voltage: int,
+    panel_current: int,
+    total_panels: int,
+    max_voltage: int,
+    max_current: int,
+    max_power: int,
+) -> Optimized | None:
+    best_config = _optimize(
+        panel_voltage, panel_current, total_panels, max_voltage, max_current
+    )
 
     # cannot find the optimal point
     if best_config is None:
@@ -119,10 +138,15 @@ panel_voltage = st.number_input("Panel Voltage (V)", min_value=1, step=1, value=
 panel_current = st.number_input("Panel Current (A)", min_value=1, step=1, value=8)
 total_panels = st.number_input("Total Number of Panels", min_value=1, step=1, value=6)
 
-panels = [Panel(panel_voltage, panel_current)] * total_panels
-
 if st.button("Optimize Configuration"):
-    best_config = optimize(panels, max_voltage, max_current, max_power)
+    inputs = (panel_voltage, panel_current, total_panels, max_voltage, max_current, max_power)
+
+    # only re-run the search when the inputs actually changed since the last click
+    if st.session_state.get("last_inputs") != inputs:
+        st.session_state["last_inputs"] = inputs
+        st.session_state["best_config"] = optimize(*inputs)
+
+    best_config = st.session_state["best_config"]
 
     if best_config is None:
         st.write("No valid configuration found within the constraints.")